@@ -1,4 +1,4 @@
-import re
+import os
 
 content = """use crate::backend::connector::{ConnectedGroup, ConnectedServer, ServerConnector};
 use crate::bindings::da::{
@@ -600,14 +600,47 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
 }
 """
 
-with open("src/com_worker.rs", "r", encoding="cp1252") as f:
-    existing = f.read()
-
-import re
-match = re.search(r'#\[cfg\(test\)\]\s*mod tests \{.*$', existing, re.DOTALL)
-tests_block = match.group(0) if match else ''
-
-with open("src/com_worker.rs", "w", encoding="utf-8") as f:
-    f.write(content + "\n" + tests_block)
+TESTS_MARKER = b"#[cfg(test)]"
+CHUNK_SIZE = 64 * 1024
+
+
+def read_tests_tail(path):
+    """Return the trailing `#[cfg(test)] mod tests { ... }` block of `path`, or ''.
+
+    The test module sits at the end of the file, so the file is read backwards in
+    64 KB chunks until the marker is found instead of loading all of it.
+    """
+    with open(path, "rb") as f:
+        pos = f.seek(0, 2)
+        buf = b""
+        while pos > 0:
+            step = min(CHUNK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            idx = buf.rfind(TESTS_MARKER)
+            while idx != -1:
+                rest = buf[idx + len(TESTS_MARKER) : idx + len(TESTS_MARKER) + 64].lstrip()
+                if rest.startswith(b"mod tests {"):
+                    return buf[idx:].decode("utf-8")
+                idx = buf.rfind(TESTS_MARKER, 0, idx)
+    return ""
+
+
+tests_block = read_tests_tail("src/com_worker.rs")
+
+# Encode once and write raw bytes: no text-mode newline translation or incremental encoder.
+data = (content + "\n" + tests_block).encode("utf-8")
+fd = os.open(
+    "src/com_worker.rs",
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+    0o666,
+)
+try:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+finally:
+    os.close(fd)
 
 print("done")
@@ -88,6 +88,18 @@ pub trait ConnectedServer {
     /// Returns an error if the server cannot resolve the item name.
     fn get_item_id(&self, item_name: &str) -> OpcResult<String>;
 
+    /// Resolve several browse names to fully-qualified item IDs.
+    ///
+    /// Returns one result per name, in input order. The default implementation
+    /// calls [`Self::get_item_id`] for each name; implementations backed by a
+    /// native batch lookup can override it.
+    fn get_item_ids(&self, item_names: &[String]) -> Vec<OpcResult<String>> {
+        item_names
+            .iter()
+            .map(|name| self.get_item_id(name))
+            .collect()
+    }
+
     /// Add a new OPC group to this server connection.
     ///
     /// # Errors
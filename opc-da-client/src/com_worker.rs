@@ -9,11 +9,36 @@ use crate::helpers::{
 use crate::opc_da::errors::{OpcError, OpcResult};
 use crate::opc_da::typedefs::{GroupHandle, ItemHandle};
 use crate::provider::{OpcValue, TagValue, WriteResult};
-use std::collections::HashMap;
+use rustc_hash::{FxHashMap, FxHashSet};
+use smallvec::SmallVec;
 use std::sync::Arc;
 use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::{Duration, Instant};
 use tokio::sync::{mpsc, oneshot};
 
+/// Number of requests that can be queued for the COM worker before senders wait.
+const REQUEST_CHANNEL_CAPACITY: usize = 1024;
+
+/// Maximum number of queued requests drained per worker wake-up.
+const MAX_BATCH: usize = 32;
+
+/// Maximum number of server connections kept in the worker's pool.
+const MAX_CACHED_SERVERS: usize = 64;
+
+/// Pooled connections left unused for this long are dropped before the next dispatch.
+const IDLE_CONNECTION_TIMEOUT: Duration = Duration::from_secs(300);
+
+/// Item count at which a persistent group is recreated instead of growing further.
+const MAX_GROUP_ITEMS: usize = 4096;
+
+/// Number of browsed tags buffered before they are published to the shared sink.
+const SINK_FLUSH_BATCH: usize = 64;
+
+/// UTF-16 code units (including the nul terminator) of an item ID encoded on the stack;
+/// longer IDs spill to the heap. Nearly all OPC item IDs fit. Must be one of the array
+/// sizes `smallvec` implements `Array` for without its `const_generics` feature.
+const INLINE_ITEM_ID_LEN: usize = 0x100;
+
 /// Represents a asynchronous request dispatched to the COM worker thread.
 pub enum ComRequest {
     /// Request to enumerate available OPC DA servers on a host.
@@ -62,6 +87,11 @@ pub enum ComRequest {
 ///
 /// Dispatches requests received over an `mpsc` channel to Windows COM interfaces while maintaining
 /// a persistent connection pool and transparently evicting stale connection handles on RPC errors.
+///
+/// The channel is a bounded `tokio::sync::mpsc` because its two ends live in different worlds:
+/// producers are async tasks that must be able to await capacity without blocking a runtime
+/// thread, while the worker is a plain OS thread that receives with `blocking_recv`/`try_recv`
+/// and never touches an async runtime.
 pub struct ComWorker<C: ServerConnector + 'static> {
     /// Channel sender for dispatching requests to the worker loop.
     pub sender: mpsc::Sender<ComRequest>,
@@ -70,14 +100,276 @@ pub struct ComWorker<C: ServerConnector + 'static> {
     _phantom: std::marker::PhantomData<C>,
 }
 
-#[allow(clippy::cast_possible_wrap)]
+/// An OPC group kept alive across requests, with the items already added to it.
+struct PersistentGroup<G> {
+    group: G,
+    handle: GroupHandle,
+    items: FxHashMap<String, ItemHandle>,
+}
+
+impl<G: ConnectedGroup> PersistentGroup<G> {
+    /// Returns the group held in `slot`, adding a new group to `server` if the slot is empty.
+    fn ensure<'a, S>(slot: &'a mut Option<Self>, server: &S, name: &str) -> OpcResult<&'a mut Self>
+    where
+        S: ConnectedServer<Group = G>,
+    {
+        if slot.is_none() {
+            let mut revised_update_rate = 0u32;
+            let mut server_handle = GroupHandle::default();
+            // Synchronous device reads and writes ignore the active state, so the group is
+            // created inactive to keep the server from scanning its items between requests.
+            let group = server.add_group(
+                name,
+                false,
+                1000,
+                GroupHandle(0),
+                0,
+                0.0,
+                0,
+                &mut revised_update_rate,
+                &mut server_handle,
+            )?;
+            tracing::debug!(group = name, "Created persistent OPC group");
+            *slot = Some(Self {
+                group,
+                handle: server_handle,
+                items: FxHashMap::default(),
+            });
+        }
+        slot.as_mut()
+            .ok_or_else(|| OpcError::Internal("Persistent OPC group missing after creation".into()))
+    }
+
+    /// Removes the group from `server`, logging rather than propagating failures.
+    fn release<S>(self, server: &S, operation: &str)
+    where
+        S: ConnectedServer<Group = G>,
+    {
+        if let Err(e) = server.remove_group(self.handle, true) {
+            tracing::warn!(error = ?e, operation, "Failed to remove OPC group during cleanup");
+        }
+    }
+}
+
+/// A pooled server connection together with its persistent groups and last-use time.
+struct CachedServer<S: ConnectedServer> {
+    server: S,
+    read_group: Option<PersistentGroup<S::Group>>,
+    write_group: Option<PersistentGroup<S::Group>>,
+    last_used: Instant,
+}
+
+impl<S: ConnectedServer> CachedServer<S> {
+    fn new(server: S) -> Self {
+        Self {
+            server,
+            read_group: None,
+            write_group: None,
+            last_used: Instant::now(),
+        }
+    }
+
+    /// Drops the group proxies without removing the groups from the server.
+    ///
+    /// Used after connection errors, where further COM calls on the proxy would only fail.
+    fn abandon_groups(&mut self) {
+        self.read_group = None;
+        self.write_group = None;
+    }
+}
+
+impl<S: ConnectedServer> Drop for CachedServer<S> {
+    fn drop(&mut self) {
+        for group in [self.read_group.take(), self.write_group.take()]
+            .into_iter()
+            .flatten()
+        {
+            group.release(&self.server, "connection_pool");
+        }
+    }
+}
+
+/// Working buffers for `handle_read`, cleared but not deallocated between reads.
+#[derive(Default)]
+struct ReadScratch {
+    pending: Vec<usize>,
+    item_id_wides: Vec<u16>,
+    offsets: Vec<usize>,
+    item_defs: Vec<tagOPCITEMDEF>,
+    server_handles: Vec<ItemHandle>,
+    valid_indices: Vec<usize>,
+}
+
+impl ReadScratch {
+    fn clear(&mut self) {
+        self.pending.clear();
+        self.item_id_wides.clear();
+        self.offsets.clear();
+        self.item_defs.clear();
+        self.server_handles.clear();
+        self.valid_indices.clear();
+    }
+}
+
+thread_local! {
+    static READ_SCRATCH: std::cell::RefCell<ReadScratch> =
+        std::cell::RefCell::new(ReadScratch::default());
+}
+
+/// Bounded pool of server connections keyed by ProgID.
+///
+/// Evicts the least recently used connection when full and drops connections that
+/// have been idle for longer than `idle_timeout`, so stale proxies are refreshed
+/// proactively instead of being held for the lifetime of the worker.
+struct ServerCache<S: ConnectedServer> {
+    entries: FxHashMap<String, CachedServer<S>>,
+    capacity: usize,
+    idle_timeout: Duration,
+}
+
+impl<S: ConnectedServer> ServerCache<S> {
+    fn new(capacity: usize, idle_timeout: Duration) -> Self {
+        Self {
+            entries: FxHashMap::default(),
+            capacity,
+            idle_timeout,
+        }
+    }
+
+    /// Returns the cached connection for `name`, creating it with `connect` on a miss.
+    fn get_or_connect(
+        &mut self,
+        name: &str,
+        connect: impl FnOnce() -> OpcResult<S>,
+    ) -> OpcResult<&mut CachedServer<S>> {
+        if self.entries.contains_key(name) {
+            tracing::trace!(server = %name, "Cache hit");
+        } else {
+            // Connect before evicting so a failed connect leaves the pool untouched.
+            let server = connect()?;
+            if self.entries.len() >= self.capacity {
+                self.evict_lru();
+            }
+            self.entries
+                .insert(name.to_string(), CachedServer::new(server));
+        }
+        // Looking up by `&str` keeps cache hits free of a key allocation.
+        let cached = self
+            .entries
+            .get_mut(name)
+            .ok_or_else(|| OpcError::Internal("Pooled connection missing after insert".into()))?;
+        cached.last_used = Instant::now();
+        Ok(cached)
+    }
+
+    /// Drops the connection for `name` without removing its groups from the server.
+    fn discard(&mut self, name: &str) {
+        if let Some(mut cached) = self.entries.remove(name) {
+            cached.abandon_groups();
+        }
+    }
+
+    /// Drops every connection that has been idle for at least `idle_timeout`.
+    ///
+    /// Like [`Self::discard`], this skips `remove_group`: evicting a batch of idle servers
+    /// must not block the worker on COM round trips to proxies that may no longer answer.
+    fn evict_idle(&mut self) {
+        let idle_timeout = self.idle_timeout;
+        self.entries.retain(|name, cached| {
+            let keep = cached.last_used.elapsed() < idle_timeout;
+            if !keep {
+                tracing::debug!(server = %name, "Dropping idle connection from pool");
+                cached.abandon_groups();
+            }
+            keep
+        });
+    }
+
+    fn evict_lru(&mut self) {
+        let oldest = self
+            .entries
+            .iter()
+            .min_by_key(|(_, cached)| cached.last_used)
+            .map(|(name, _)| name.clone());
+        if let Some(name) = oldest {
+            tracing::debug!(server = %name, "Pool full, evicting least recently used connection");
+            self.discard(&name);
+        }
+    }
+}
+
+/// Collects browsed tags and publishes them to the caller's shared sink and progress
+/// counter in batches.
+///
+/// The sink lock and the progress `fetch_add` are taken once per [`SINK_FLUSH_BATCH`] tags
+/// instead of once per tag. Pending tags are flushed on drop, so callers harvesting the
+/// sink after an error or timeout still see everything discovered so far.
+struct TagCollector<'a> {
+    tags: Vec<String>,
+    sink: &'a Arc<std::sync::Mutex<Vec<String>>>,
+    progress: &'a Arc<AtomicUsize>,
+    flushed: usize,
+}
+
+impl<'a> TagCollector<'a> {
+    fn new(sink: &'a Arc<std::sync::Mutex<Vec<String>>>, progress: &'a Arc<AtomicUsize>) -> Self {
+        Self {
+            tags: Vec::new(),
+            sink,
+            progress,
+            flushed: 0,
+        }
+    }
+
+    fn len(&self) -> usize {
+        self.tags.len()
+    }
+
+    fn push(&mut self, tag: String) {
+        self.tags.push(tag);
+        if self.tags.len() - self.flushed >= SINK_FLUSH_BATCH {
+            self.flush();
+        }
+    }
+
+    fn flush(&mut self) {
+        if self.flushed == self.tags.len() {
+            return;
+        }
+        // The sink only ever holds complete tag names, so a poisoned lock is still usable.
+        self.sink
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner)
+            .extend_from_slice(&self.tags[self.flushed..]);
+        self.progress
+            .fetch_add(self.tags.len() - self.flushed, Ordering::Relaxed);
+        self.flushed = self.tags.len();
+    }
+
+    /// Flushes any pending tags and returns the complete list.
+    fn finish(mut self) -> Vec<String> {
+        self.flush();
+        // Everything is published; reset so the flush in `Drop` sees nothing pending.
+        self.flushed = 0;
+        std::mem::take(&mut self.tags)
+    }
+}
+
+impl Drop for TagCollector<'_> {
+    fn drop(&mut self) {
+        self.flush();
+    }
+}
+
+/// Returns `true` for RPC/COM failures that mean the server proxy is dead and must be
+/// reconnected (`RPC_S_SERVER_UNAVAILABLE`, `RPC_S_CALL_FAILED_DNE`, `RPC_S_CALL_FAILED`,
+/// `CO_E_SERVER_EXEC_FAILURE`).
 fn is_connection_error(err: &OpcError) -> bool {
     if let OpcError::Com { source } = err {
-        let code = source.code().0;
-        code == windows::core::HRESULT(0x8007_06BA_u32 as i32).0
-            || code == windows::core::HRESULT(0x8007_06BF_u32 as i32).0
-            || code == windows::core::HRESULT(0x8007_06BE_u32 as i32).0
-            || code == windows::core::HRESULT(0x8008_0005_u32 as i32).0
+        matches!(
+            source.code().0.cast_unsigned(),
+            0x8007_06BA | 0x8007_06BF | 0x8007_06BE | 0x8008_0005
+        )
     } else {
         false
     }
@@ -94,10 +386,9 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
         }
     }
 
-    #[allow(clippy::too_many_lines)]
     #[tracing::instrument(skip(connector))]
     pub fn start(connector: Arc<C>) -> Result<Self, OpcError> {
-        let (tx, mut rx) = mpsc::channel(32);
+        let (tx, mut rx) = mpsc::channel(REQUEST_CHANNEL_CAPACITY);
         let (init_tx, init_rx) = std::sync::mpsc::channel();
 
         let handle = std::thread::spawn(move || {
@@ -116,82 +407,20 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
                 }
             };
 
-            let mut cache: HashMap<String, C::Server> = HashMap::new();
+            let mut cache: ServerCache<C::Server> =
+                ServerCache::new(MAX_CACHED_SERVERS, IDLE_CONNECTION_TIMEOUT);
+            let mut batch: Vec<ComRequest> = Vec::with_capacity(MAX_BATCH);
 
             while let Some(req) = rx.blocking_recv() {
-                match req {
-                    ComRequest::ListServers { host, reply } => {
-                        let span = tracing::info_span!("opc.list_servers", host = %host);
-                        let _enter = span.enter();
-                        #[cfg(feature = "dev-diagnostics")]
-                        tracing::trace!(host = %host, "list_servers: starting operation");
-                        let start = std::time::Instant::now();
-                        let servers = connector.enumerate_servers();
-                        if let Ok(s) = &servers {
-                            tracing::info!(
-                                count = s.len(),
-                                elapsed_ms =
-                                    u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
-                                "list_servers completed"
-                            );
-                        } else if let Err(e) = &servers {
-                            crate::opc_da::errors::log_opc_error(e, "list_servers");
-                            tracing::error!(
-                                error = ?e,
-                                elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
-                                "list_servers failed"
-                            );
-                        }
-                        let _ = reply.send(servers);
-                    }
-
-                    ComRequest::ReadTagValues {
-                        server,
-                        tag_ids,
-                        reply,
-                    } => {
-                        let result = Self::dispatch_with_retry(
-                            &mut cache,
-                            &connector,
-                            &server,
-                            |opc_server| Self::handle_read(&server, &tag_ids, opc_server),
-                        );
-                        let _ = reply.send(result);
-                    }
-                    ComRequest::WriteTagValue {
-                        server,
-                        tag_id,
-                        value,
-                        reply,
-                    } => {
-                        let result = Self::dispatch_with_retry(
-                            &mut cache,
-                            &connector,
-                            &server,
-                            |opc_server| Self::handle_write(&server, &tag_id, &value, opc_server),
-                        );
-                        let _ = reply.send(result);
-                    }
-                    ComRequest::BrowseTags {
-                        server,
-                        max_tags,
-                        progress,
-                        tags_sink,
-                        reply,
-                    } => {
-                        let result = Self::dispatch_with_retry(
-                            &mut cache,
-                            &connector,
-                            &server,
-                            |opc_server| {
-                                Self::handle_browse(
-                                    &server, max_tags, &progress, &tags_sink, opc_server,
-                                )
-                            },
-                        );
-                        let _ = reply.send(result);
+                batch.push(req);
+                while batch.len() < MAX_BATCH {
+                    match rx.try_recv() {
+                        Ok(req) => batch.push(req),
+                        Err(_) => break,
                     }
                 }
+                cache.evict_idle();
+                Self::dispatch_batch(&mut batch, &mut cache, &connector);
             }
 
             tracing::debug!("COM worker thread exiting cleanly");
@@ -210,6 +439,12 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
         })
     }
 
+    /// Builds a request with a fresh reply channel, enqueues it, and awaits the worker's reply.
+    ///
+    /// The reply channel is a `oneshot`: `Sender::send` consumes the sender and the receiver
+    /// is spent once awaited, so channels are single-use by construction and cannot be pooled
+    /// or recycled across requests. Its cost (one small allocation) is negligible next to the
+    /// COM round trip performed by the worker.
     #[tracing::instrument(skip(self, req_builder))]
     pub async fn send_request<F, R>(&self, req_builder: F) -> OpcResult<R>
     where
@@ -226,69 +461,233 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
 
         let (tx, rx) = oneshot::channel();
         let req = req_builder(tx);
-
-        self.sender
-            .send(req)
-            .await
-            .map_err(|_| OpcError::Internal("COM worker channel closed (worker stopped)".into()))?;
+        let closed = || OpcError::Internal("COM worker channel closed (worker stopped)".into());
+
+        // Enqueue without suspending while the channel has room; only wait for capacity
+        // (back-pressure) when the worker has fallen behind.
+        match self.sender.try_send(req) {
+            Ok(()) => {}
+            Err(mpsc::error::TrySendError::Full(req)) => {
+                self.sender.send(req).await.map_err(|_| closed())?;
+            }
+            Err(mpsc::error::TrySendError::Closed(_)) => return Err(closed()),
+        }
 
         rx.await
             .map_err(|_| OpcError::Internal("COM worker shut down during request".into()))?
     }
 
+    /// Dispatches a drained batch of requests in arrival order.
+    ///
+    /// Consecutive `ReadTagValues` requests targeting the same server are coalesced into a
+    /// single read so they share one group setup and one COM `Read` round trip.
+    fn dispatch_batch(
+        batch: &mut Vec<ComRequest>,
+        cache: &mut ServerCache<C::Server>,
+        connector: &Arc<C>,
+    ) {
+        let mut requests = batch.drain(..).peekable();
+        while let Some(req) = requests.next() {
+            match req {
+                ComRequest::ReadTagValues {
+                    server,
+                    mut tag_ids,
+                    reply,
+                } => {
+                    let mut replies = vec![(tag_ids.len(), reply)];
+                    while let Some(ComRequest::ReadTagValues { server: next, .. }) = requests.peek()
+                        && *next == server
+                    {
+                        if let Some(ComRequest::ReadTagValues {
+                            tag_ids: more,
+                            reply,
+                            ..
+                        }) = requests.next()
+                        {
+                            replies.push((more.len(), reply));
+                            tag_ids.extend(more);
+                        }
+                    }
+
+                    if replies.len() > 1 {
+                        tracing::debug!(
+                            server = %server,
+                            requests = replies.len(),
+                            tag_count = tag_ids.len(),
+                            "Coalescing concurrent reads into a single group read"
+                        );
+                    }
+                    Self::dispatch_reads(cache, connector, &server, &tag_ids, replies);
+                }
+                other => Self::dispatch(other, cache, connector),
+            }
+        }
+    }
+
+    /// Performs one read for `tag_ids` and splits the values back across `replies`.
+    ///
+    /// Each reply is paired with the number of consecutive tags it asked for.
+    fn dispatch_reads(
+        cache: &mut ServerCache<C::Server>,
+        connector: &Arc<C>,
+        server: &str,
+        tag_ids: &[String],
+        replies: Vec<(usize, oneshot::Sender<OpcResult<Vec<TagValue>>>)>,
+    ) {
+        let result = Self::dispatch_with_retry(cache, connector, server, |cached| {
+            Self::handle_read(server, tag_ids, cached)
+        });
+        match result {
+            Ok(values) if replies.len() == 1 => {
+                // A lone request owns the whole result; only coalesced reads need splitting.
+                if let Some((_, reply)) = replies.into_iter().next() {
+                    let _ = reply.send(Ok(values));
+                }
+            }
+            Ok(values) => {
+                let mut values = values.into_iter();
+                for (len, reply) in replies {
+                    let _ = reply.send(Ok(values.by_ref().take(len).collect()));
+                }
+            }
+            Err(e) => {
+                for (_, reply) in replies {
+                    let _ = reply.send(Err(e.clone()));
+                }
+            }
+        }
+    }
+
+    fn dispatch(req: ComRequest, cache: &mut ServerCache<C::Server>, connector: &Arc<C>) {
+        match req {
+            ComRequest::ListServers { host, reply } => {
+                let _span = tracing::enabled!(tracing::Level::INFO)
+                    .then(|| tracing::info_span!("opc.list_servers", host = %host).entered());
+                #[cfg(feature = "dev-diagnostics")]
+                tracing::trace!(host = %host, "list_servers: starting operation");
+                let start = std::time::Instant::now();
+                let servers = connector.enumerate_servers();
+                if let Ok(s) = &servers {
+                    tracing::info!(
+                        count = s.len(),
+                        elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
+                        "list_servers completed"
+                    );
+                } else if let Err(e) = &servers {
+                    crate::opc_da::errors::log_opc_error(e, "list_servers");
+                    tracing::error!(
+                        error = ?e,
+                        elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
+                        "list_servers failed"
+                    );
+                }
+                let _ = reply.send(servers);
+            }
+
+            ComRequest::ReadTagValues {
+                server,
+                tag_ids,
+                reply,
+            } => {
+                let replies = vec![(tag_ids.len(), reply)];
+                Self::dispatch_reads(cache, connector, &server, &tag_ids, replies);
+            }
+            ComRequest::WriteTagValue {
+                server,
+                tag_id,
+                value,
+                reply,
+            } => {
+                let result = Self::dispatch_with_retry(cache, connector, &server, |cached| {
+                    Self::handle_write(&server, &tag_id, &value, cached)
+                });
+                let _ = reply.send(result);
+            }
+            ComRequest::BrowseTags {
+                server,
+                max_tags,
+                progress,
+                tags_sink,
+                reply,
+            } => {
+                let result = Self::dispatch_with_retry(cache, connector, &server, |cached| {
+                    Self::handle_browse(&server, max_tags, &progress, &tags_sink, &cached.server)
+                });
+                let _ = reply.send(result);
+            }
+        }
+    }
+
     fn dispatch_with_retry<F, R>(
-        cache: &mut HashMap<String, C::Server>,
+        cache: &mut ServerCache<C::Server>,
         connector: &Arc<C>,
         server_name: &str,
         operation: F,
     ) -> OpcResult<R>
     where
-        F: Fn(&C::Server) -> OpcResult<R>,
+        F: Fn(&mut CachedServer<C::Server>) -> OpcResult<R>,
     {
-        let server_ref = match cache.entry(server_name.to_string()) {
-            std::collections::hash_map::Entry::Occupied(e) => {
-                tracing::trace!(server = %server_name, "Cache hit");
-                e.into_mut()
-            }
-            std::collections::hash_map::Entry::Vacant(e) => {
-                tracing::debug!(server = %server_name, "Cache miss, connecting");
-                let srv = connector.connect(server_name)?;
-                tracing::info!(server = %server_name, "Connection established, added to pool");
-                e.insert(srv)
-            }
-        };
-
-        match operation(server_ref) {
+        let cached = cache.get_or_connect(server_name, || {
+            tracing::debug!(server = %server_name, "Cache miss, connecting");
+            let srv = connector.connect(server_name)?;
+            tracing::info!(server = %server_name, "Connection established, added to pool");
+            Ok(srv)
+        })?;
+
+        match operation(cached) {
             Err(e) if is_connection_error(&e) => {
                 tracing::warn!(server = %server_name, error = ?e, "Evicting stale connection");
-                cache.remove(server_name);
+                cached.abandon_groups();
                 tracing::debug!(server = %server_name, "Reconnecting");
-                let fresh_srv = connector.connect(server_name).map_err(|connect_e| {
-                    tracing::error!(error = ?connect_e, "Reconnect failed");
-                    connect_e
-                })?;
-                let fresh_ref = &fresh_srv;
-                let result = operation(fresh_ref);
-                tracing::info!(server = %server_name, "Reconnection successful, pool updated");
-                cache.insert(server_name.to_string(), fresh_srv);
+                let fresh_srv = match connector.connect(server_name) {
+                    Ok(srv) => srv,
+                    Err(connect_e) => {
+                        tracing::error!(error = ?connect_e, "Reconnect failed");
+                        cache.discard(server_name);
+                        return Err(connect_e);
+                    }
+                };
+                // Swap the fresh connection into the slot we already hold instead of
+                // removing and re-inserting the entry.
+                *cached = CachedServer::new(fresh_srv);
+                let result = operation(cached);
+                match &result {
+                    Err(e) if is_connection_error(e) => {
+                        // Still unreachable: don't keep a connection that is about to be
+                        // evicted again.
+                        tracing::warn!(
+                            server = %server_name,
+                            error = ?e,
+                            "Retry failed, dropping connection"
+                        );
+                        cache.discard(server_name);
+                    }
+                    _ => {
+                        tracing::info!(
+                            server = %server_name,
+                            "Reconnection successful, pool updated"
+                        );
+                    }
+                }
                 result
             }
             other => other,
         }
     }
 
-    #[allow(clippy::too_many_lines)]
     fn handle_read(
         server_name: &str,
         tag_ids: &[String],
-        opc_server: &C::Server,
+        cached: &mut CachedServer<C::Server>,
     ) -> OpcResult<Vec<TagValue>> {
-        let span = tracing::info_span!(
-            "opc.read_tag_values",
-            server = %server_name,
-            tag_count = tag_ids.len()
-        );
-        let _enter = span.enter();
+        let _span = tracing::enabled!(tracing::Level::INFO).then(|| {
+            tracing::info_span!(
+                "opc.read_tag_values",
+                server = %server_name,
+                tag_count = tag_ids.len()
+            )
+            .entered()
+        });
         #[cfg(feature = "dev-diagnostics")]
         tracing::trace!(
             server = %server_name,
@@ -298,52 +697,22 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
         );
         let start = std::time::Instant::now();
 
-        let mut revised_update_rate = 0u32;
-        let mut server_handle = GroupHandle::default();
-        let group = opc_server.add_group(
-            "opc-da-client-read",
-            true,
-            1000,
-            server_handle,
-            0,
-            0.0,
-            0,
-            &mut revised_update_rate,
-            &mut server_handle,
-        )?;
-
-        let item_id_wides: Vec<Vec<u16>> = tag_ids
-            .iter()
-            .map(|tag_id| tag_id.encode_utf16().chain(std::iter::once(0)).collect())
-            .collect();
-
-        let item_defs: Vec<tagOPCITEMDEF> = item_id_wides
-            .iter()
-            .enumerate()
-            .map(|(idx, wide)| tagOPCITEMDEF {
-                szAccessPath: windows::core::PWSTR::null(),
-                szItemID: windows::core::PWSTR(wide.as_ptr().cast_mut()),
-                bActive: windows::Win32::Foundation::TRUE,
-                #[allow(clippy::cast_possible_truncation)]
-                hClient: idx as u32,
-                dwBlobSize: 0,
-                pBlob: std::ptr::null_mut(),
-                vtRequestedDataType: 0,
-                wReserved: 0,
-            })
-            .collect();
-
-        let (results, errors) = group.add_items(&item_defs)?;
+        let CachedServer {
+            server: opc_server,
+            read_group,
+            ..
+        } = cached;
+        let opc_server = &*opc_server;
 
-        // RemoteArray::len() returns u32; tag_ids.len() returns usize.
-        if results.len() as usize != tag_ids.len() || errors.len() as usize != tag_ids.len() {
-            if let Err(e) = opc_server.remove_group(server_handle, true) {
-                tracing::warn!(error = ?e, operation = "read_tag_values", "Failed to remove OPC group during cleanup");
-            }
-            return Err(OpcError::Internal(
-                "OPC server returned mismatched result array sizes".into(),
-            ));
+        if read_group
+            .as_ref()
+            .is_some_and(|group| group.items.len() >= MAX_GROUP_ITEMS)
+            && let Some(group) = read_group.take()
+        {
+            tracing::debug!(items = group.items.len(), "Read group full, recreating");
+            group.release(opc_server, "read_tag_values");
         }
+        let group = PersistentGroup::ensure(read_group, opc_server, "opc-da-client-read")?;
 
         let mut tag_values: Vec<TagValue> = tag_ids
             .iter()
@@ -355,39 +724,149 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
             })
             .collect();
 
-        let mut server_handles: Vec<ItemHandle> = Vec::new();
-        let mut valid_indices = Vec::new();
+        if let Err(e) = Self::read_with_group(group, tag_ids, &mut tag_values) {
+            // The group may be in an unknown state; start from a fresh one next time.
+            if let Some(group) = read_group.take()
+                && !is_connection_error(&e)
+            {
+                group.release(opc_server, "read_tag_values");
+            }
+            return Err(e);
+        }
 
-        for (idx, (item_result, error)) in results
-            .as_slice()
-            .iter()
-            .zip(errors.as_slice().iter())
-            .enumerate()
-        {
-            if error.is_ok() {
-                server_handles.push(ItemHandle(item_result.hServer));
+        tracing::info!(
+            count = tag_values.len(),
+            elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
+            "read_tag_values completed"
+        );
+        Ok(tag_values)
+    }
+
+    /// Reads `tag_ids` through a persistent group, adding only the tags it does not hold yet.
+    ///
+    /// Working buffers come from the worker thread's [`ReadScratch`], so steady-state reads
+    /// only allocate the returned values.
+    fn read_with_group(
+        group: &mut PersistentGroup<<C::Server as ConnectedServer>::Group>,
+        tag_ids: &[String],
+        tag_values: &mut [TagValue],
+    ) -> OpcResult<()> {
+        READ_SCRATCH.with_borrow_mut(|scratch| {
+            scratch.clear();
+            Self::read_with_scratch(group, tag_ids, tag_values, scratch)
+        })
+    }
+
+    fn read_with_scratch(
+        group: &mut PersistentGroup<<C::Server as ConnectedServer>::Group>,
+        tag_ids: &[String],
+        tag_values: &mut [TagValue],
+        scratch: &mut ReadScratch,
+    ) -> OpcResult<()> {
+        let ReadScratch {
+            pending,
+            item_id_wides,
+            offsets,
+            item_defs,
+            server_handles,
+            valid_indices,
+        } = scratch;
+
+        // The scratch buffers are reused across reads; reserving up front means a larger
+        // batch than any before it grows each buffer once instead of geometrically.
+        pending.reserve(tag_ids.len());
+        server_handles.reserve(tag_ids.len());
+        valid_indices.reserve(tag_ids.len());
+
+        let mut seen = FxHashSet::default();
+        pending.extend((0..tag_ids.len()).filter(|&idx| {
+            !group.items.contains_key(&tag_ids[idx]) && seen.insert(tag_ids[idx].as_str())
+        }));
+
+        let mut rejected: FxHashMap<&str, String> = FxHashMap::default();
+        if !pending.is_empty() {
+            // Encode all pending IDs into one nul-separated UTF-16 buffer. UTF-16 never needs
+            // more code units than UTF-8 has bytes, so the buffer grows at most once.
+            item_id_wides.reserve(pending.iter().map(|&idx| tag_ids[idx].len() + 1).sum());
+            for &idx in pending.iter() {
+                offsets.push(item_id_wides.len());
+                item_id_wides.extend(tag_ids[idx].encode_utf16());
+                item_id_wides.push(0);
+            }
+
+            // Pointers are taken only after the buffer is complete, so no reallocation can
+            // invalidate them before `add_items` returns.
+            item_defs.extend(
+                offsets
+                    .iter()
+                    .enumerate()
+                    .map(|(idx, &offset)| tagOPCITEMDEF {
+                        szAccessPath: windows::core::PWSTR::null(),
+                        szItemID: windows::core::PWSTR(item_id_wides[offset..].as_ptr().cast_mut()),
+                        bActive: windows::Win32::Foundation::TRUE,
+                        #[allow(clippy::cast_possible_truncation)]
+                        hClient: idx as u32,
+                        dwBlobSize: 0,
+                        pBlob: std::ptr::null_mut(),
+                        vtRequestedDataType: 0,
+                        wReserved: 0,
+                    }),
+            );
+
+            let (results, errors) = group.group.add_items(item_defs)?;
+
+            // RemoteArray::len() returns u32; pending.len() returns usize.
+            if results.len() as usize != pending.len() || errors.len() as usize != pending.len() {
+                return Err(OpcError::Internal(
+                    "OPC server returned mismatched result array sizes".into(),
+                ));
+            }
+
+            for ((item_result, error), &idx) in results
+                .as_slice()
+                .iter()
+                .zip(errors.as_slice().iter())
+                .zip(pending.iter())
+            {
+                if error.is_ok() {
+                    group
+                        .items
+                        .insert(tag_ids[idx].clone(), ItemHandle(item_result.hServer));
+                } else {
+                    let hint = format_hresult(*error);
+                    tracing::warn!(
+                        tag = %tag_ids[idx],
+                        error = %hint,
+                        "read_tag_values: add_items rejected tag"
+                    );
+                    rejected.insert(tag_ids[idx].as_str(), hint);
+                }
+            }
+        }
+
+        for (idx, tag_id) in tag_ids.iter().enumerate() {
+            if let Some(handle) = group.items.get(tag_id) {
+                server_handles.push(*handle);
                 valid_indices.push(idx);
-            } else {
-                let hint = format_hresult(*error);
-                tracing::warn!(
-                    tag = %tag_ids[idx],
-                    error = %hint,
-                    "read_tag_values: add_items rejected tag"
-                );
+            } else if let Some(hint) = rejected.get(tag_id.as_str()) {
                 tag_values[idx].quality = format!("Bad — {hint}");
             }
         }
 
         if server_handles.is_empty() {
-            if let Err(e) = opc_server.remove_group(server_handle, true) {
-                tracing::warn!(error = ?e, operation = "read_tag_values", "Failed to remove OPC group during cleanup");
-            }
-            return Ok(tag_values);
+            return Ok(());
         }
 
-        let (item_states, read_errors) = group.read(OPC_DS_DEVICE, &server_handles)?;
+        let (item_states, read_errors) = group.group.read(OPC_DS_DEVICE, server_handles)?;
         let item_states_slice = item_states.as_slice();
         let read_errors_slice = read_errors.as_slice();
+        if item_states_slice.len() != server_handles.len()
+            || read_errors_slice.len() != server_handles.len()
+        {
+            return Err(OpcError::Internal(
+                "OPC server returned mismatched result array sizes".into(),
+            ));
+        }
 
         for (i, idx) in valid_indices.iter().enumerate() {
             let state = &item_states_slice[i];
@@ -416,31 +895,23 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
                 timestamp: filetime_to_string(state.ftTimeStamp),
             };
         }
-
-        tracing::info!(
-            count = tag_values.len(),
-            elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
-            "read_tag_values completed"
-        );
-        if let Err(e) = opc_server.remove_group(server_handle, true) {
-            tracing::warn!(error = ?e, operation = "read_tag_values", "Failed to remove OPC group during cleanup");
-        }
-        Ok(tag_values)
+        Ok(())
     }
 
-    #[allow(clippy::too_many_lines)]
     fn handle_write(
         server_name: &str,
         tag_id: &str,
         value: &OpcValue,
-        opc_server: &C::Server,
+        cached: &mut CachedServer<C::Server>,
     ) -> OpcResult<WriteResult> {
-        let span = tracing::info_span!(
-            "opc.write_tag_value",
-            server = %server_name,
-            tag = %tag_id
-        );
-        let _enter = span.enter();
+        let _span = tracing::enabled!(tracing::Level::INFO).then(|| {
+            tracing::info_span!(
+                "opc.write_tag_value",
+                server = %server_name,
+                tag = %tag_id
+            )
+            .entered()
+        });
         #[cfg(feature = "dev-diagnostics")]
         tracing::trace!(
             server = %server_name,
@@ -450,73 +921,97 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
         );
         let start = std::time::Instant::now();
 
-        let mut revised_update_rate = 0u32;
-        let mut server_handle = GroupHandle::default();
-        let group = opc_server.add_group(
-            "opc-da-client-write",
-            true,
-            1000,
-            GroupHandle(0),
-            0,
-            0.0,
-            0,
-            &mut revised_update_rate,
-            &mut server_handle,
-        )?;
-
-        let mut item_id_wide: Vec<u16> = tag_id.encode_utf16().chain(std::iter::once(0)).collect();
-        let item_def = tagOPCITEMDEF {
-            szAccessPath: windows::core::PWSTR::null(),
-            szItemID: windows::core::PWSTR(item_id_wide.as_mut_ptr()),
-            bActive: windows::Win32::Foundation::TRUE,
-            hClient: 0,
-            dwBlobSize: 0,
-            pBlob: std::ptr::null_mut(),
-            vtRequestedDataType: 0,
-            wReserved: 0,
-        };
-
-        let (results, errors) = group.add_items(&[item_def])?;
-        let item_res = results
-            .as_slice()
-            .first()
-            .ok_or_else(|| OpcError::Internal("Server returned empty item results".to_string()))?;
-        let item_err = errors
-            .as_slice()
-            .first()
-            .ok_or_else(|| OpcError::Internal("Server returned empty item errors".to_string()))?;
+        let CachedServer {
+            server: opc_server,
+            write_group,
+            ..
+        } = cached;
+        let opc_server = &*opc_server;
 
-        if let Err(e) = item_err.ok() {
-            tracing::warn!(error = ?e, "write_tag_value: failed to add tag to group");
-            if let Err(e) = opc_server.remove_group(server_handle, true) {
-                tracing::warn!(error = ?e, operation = "write_tag_value", "Failed to remove OPC group during cleanup");
-            }
-            return Ok(WriteResult {
-                tag_id: tag_id.to_string(),
-                success: false,
-                error: Some(format!("Failed to add tag: {}", format_hresult(*item_err))),
-            });
+        if write_group
+            .as_ref()
+            .is_some_and(|group| group.items.len() >= MAX_GROUP_ITEMS)
+            && let Some(group) = write_group.take()
+        {
+            tracing::debug!(items = group.items.len(), "Write group full, recreating");
+            group.release(opc_server, "write_tag_value");
         }
+        let group = PersistentGroup::ensure(write_group, opc_server, "opc-da-client-write")?;
 
-        let item_handle = ItemHandle(item_res.hServer);
-        let variant = opc_value_to_variant(value);
+        let result = Self::write_with_group(group, tag_id, value, start);
+        if let Err(e) = &result
+            && let Some(group) = write_group.take()
+            && !is_connection_error(e)
+        {
+            // The group may be in an unknown state; start from a fresh one next time.
+            group.release(opc_server, "write_tag_value");
+        }
+        result
+    }
 
-        let write_errors = group.write(&[item_handle], &[variant])?;
-        let write_err = write_errors
-            .as_slice()
+    /// Writes `value` through a persistent group, adding the tag only on its first write.
+    fn write_with_group(
+        group: &mut PersistentGroup<<C::Server as ConnectedServer>::Group>,
+        tag_id: &str,
+        value: &OpcValue,
+        start: std::time::Instant,
+    ) -> OpcResult<WriteResult> {
+        let item_handle = if let Some(handle) = group.items.get(tag_id) {
+            *handle
+        } else {
+            let mut item_id_wide: SmallVec<[u16; INLINE_ITEM_ID_LEN]> =
+                tag_id.encode_utf16().chain(std::iter::once(0)).collect();
+            let item_def = tagOPCITEMDEF {
+                szAccessPath: windows::core::PWSTR::null(),
+                szItemID: windows::core::PWSTR(item_id_wide.as_mut_ptr()),
+                bActive: windows::Win32::Foundation::TRUE,
+                hClient: 0,
+                dwBlobSize: 0,
+                pBlob: std::ptr::null_mut(),
+                vtRequestedDataType: 0,
+                wReserved: 0,
+            };
+
+            let (results, errors) = group.group.add_items(&[item_def])?;
+            let item_res = results.as_slice().first().ok_or_else(|| {
+                OpcError::Internal("Server returned empty item results".to_string())
+            })?;
+            let item_err = errors.as_slice().first().ok_or_else(|| {
+                OpcError::Internal("Server returned empty item errors".to_string())
+            })?;
+
+            if let Err(e) = item_err.ok() {
+                tracing::warn!(error = ?e, "write_tag_value: failed to add tag to group");
+                return Ok(WriteResult {
+                    tag_id: tag_id.to_string(),
+                    success: false,
+                    error: Some(format!("Failed to add tag: {}", format_hresult(*item_err))),
+                });
+            }
+
+            let handle = ItemHandle(item_res.hServer);
+            group.items.insert(tag_id.to_string(), handle);
+            handle
+        };
+
+        let variant = opc_value_to_variant(value);
+
+        let write_errors = group.group.write(&[item_handle], &[variant])?;
+        let write_err = write_errors
+            .as_slice()
             .first()
             .ok_or_else(|| OpcError::Internal("Server returned empty write errors".to_string()))?;
 
-        let write_result = if write_err.is_ok() {
+        if write_err.is_ok() {
             tracing::info!(
                 elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
                 "write_tag_value completed"
             );
-            WriteResult {
+            Ok(WriteResult {
                 tag_id: tag_id.to_string(),
                 success: true,
                 error: None,
-            }
+            })
         } else {
             let msg = format_hresult(*write_err);
             tracing::warn!(
@@ -524,17 +1019,12 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
                 elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
                 "write_tag_value: server rejected write"
             );
-            WriteResult {
+            Ok(WriteResult {
                 tag_id: tag_id.to_string(),
                 success: false,
                 error: Some(msg),
-            }
-        };
-
-        if let Err(e) = opc_server.remove_group(server_handle, true) {
-            tracing::warn!(error = ?e, operation = "write_tag_value", "Failed to remove OPC group during cleanup");
+            })
         }
-        Ok(write_result)
     }
 
     fn handle_browse(
@@ -544,8 +1034,9 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
         tags_sink: &Arc<std::sync::Mutex<Vec<String>>>,
         opc_server: &C::Server,
     ) -> OpcResult<Vec<String>> {
-        let span = tracing::info_span!("opc.browse_tags", server = %server_name, max_tags);
-        let _enter = span.enter();
+        let _span = tracing::enabled!(tracing::Level::INFO).then(|| {
+            tracing::info_span!("opc.browse_tags", server = %server_name, max_tags).entered()
+        });
         #[cfg(feature = "dev-diagnostics")]
         tracing::trace!(
             server = %server_name,
@@ -555,7 +1046,7 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
         let start = std::time::Instant::now();
 
         let org = opc_server.query_organization()?;
-        let mut tags = Vec::new();
+        let mut tags = TagCollector::new(tags_sink, progress);
 
         if org == OPC_NS_FLAT.0 as u32 {
             let string_iter = opc_server.browse_opc_item_ids(OPC_LEAF.0 as u32, Some(""), 0, 0)?;
@@ -563,23 +1054,14 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
                 if tags.len() >= max_tags {
                     break;
                 }
-                let tag = tag_res?;
-                tags.push(tag.clone());
-                if let Ok(mut sink) = tags_sink.lock() {
-                    sink.push(tag);
-                }
-                progress.fetch_add(1, Ordering::Relaxed);
+                tags.push(tag_res?);
             }
         } else {
             let use_flat = match opc_server.browse_opc_item_ids(OPC_FLAT.0 as u32, Some(""), 0, 0) {
                 Ok(mut flat_enum) => match flat_enum.next() {
                     Some(Ok(first_tag)) => {
                         tracing::info!("OPC_FLAT browse supported — using fast flat enumeration");
-                        tags.push(first_tag.clone());
-                        if let Ok(mut sink) = tags_sink.lock() {
-                            sink.push(first_tag);
-                        }
-                        progress.fetch_add(1, Ordering::Relaxed);
+                        tags.push(first_tag);
 
                         for tag_res in flat_enum {
                             if tags.len() >= max_tags {
@@ -587,11 +1069,7 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
                             }
                             match tag_res {
                                 Ok(tag) => {
-                                    tags.push(tag.clone());
-                                    if let Ok(mut sink) = tags_sink.lock() {
-                                        sink.push(tag);
-                                    }
-                                    progress.fetch_add(1, Ordering::Relaxed);
+                                    tags.push(tag);
                                 }
                                 Err(e) => {
                                     tracing::warn!(error = ?e, "OPC_FLAT tag iteration error, skipping");
@@ -616,7 +1094,7 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
             };
 
             if !use_flat {
-                Self::browse_recursive(opc_server, &mut tags, max_tags, progress, tags_sink, 0)?;
+                Self::browse_hierarchy(opc_server, &mut tags, max_tags)?;
             }
         }
         tracing::info!(
@@ -624,25 +1102,89 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
             elapsed_ms = u64::try_from(start.elapsed().as_millis()).unwrap_or(u64::MAX),
             "browse_tags completed"
         );
-        Ok(tags)
+        Ok(tags.finish())
     }
 
-    fn browse_recursive(
+    /// Walks a hierarchical namespace depth-first, collecting leaf item IDs.
+    ///
+    /// Uses an explicit stack of pending branches instead of recursion. Errors below the
+    /// starting level are logged and the affected branch is skipped; errors at the starting
+    /// level are returned.
+    fn browse_hierarchy(
         server: &C::Server,
-        tags: &mut Vec<String>,
+        tags: &mut TagCollector<'_>,
         max_tags: usize,
-        progress: &Arc<AtomicUsize>,
-        tags_sink: &Arc<std::sync::Mutex<Vec<String>>>,
-        depth: usize,
     ) -> OpcResult<()> {
         const MAX_DEPTH: usize = 50;
-        if depth > MAX_DEPTH || tags.len() >= max_tags {
-            if depth > MAX_DEPTH {
-                tracing::warn!(depth, "Max browse depth reached, truncating");
-            }
+        if tags.len() >= max_tags {
             return Ok(());
         }
 
+        // One entry per level below the current browse position; the last entry holds the
+        // branches still to visit at the current position.
+        let mut stack: Vec<std::vec::IntoIter<String>> =
+            vec![Self::browse_level(server, tags, max_tags)?.into_iter()];
+
+        while let Some(branches) = stack.last_mut() {
+            if tags.len() >= max_tags {
+                // Climb back to the starting position: the pooled connection's next browse
+                // is relative to wherever this one leaves it.
+                for _ in 1..stack.len() {
+                    if let Err(e) = server.change_browse_position(OPC_BROWSE_UP.0 as u32, "") {
+                        tracing::warn!(error = ?e, "Failed to browse up after reaching max_tags");
+                        break;
+                    }
+                }
+                break;
+            }
+
+            let Some(branch) = branches.next() else {
+                stack.pop();
+                if !stack.is_empty()
+                    && let Err(e) = server.change_browse_position(OPC_BROWSE_UP.0 as u32, "")
+                {
+                    tracing::warn!(error = ?e, "Failed to browse up, stopping recursion");
+                    // The position is now unknown: abandon the parent's remaining branches
+                    // and let the grandparent navigate up from here.
+                    if let Some(parent) = stack.last_mut() {
+                        *parent = Vec::new().into_iter();
+                    }
+                }
+                continue;
+            };
+
+            if let Err(e) = server.change_browse_position(OPC_BROWSE_DOWN.0 as u32, &branch) {
+                tracing::warn!(
+                    branch = %branch,
+                    error = ?e,
+                    "Failed to browse down, skipping branch"
+                );
+                continue;
+            }
+
+            // The new level sits at depth `stack.len()`; an empty entry still navigates up.
+            let depth = stack.len();
+            let children = if depth > MAX_DEPTH {
+                tracing::warn!(depth, "Max browse depth reached, truncating");
+                Vec::new()
+            } else {
+                Self::browse_level(server, tags, max_tags).unwrap_or_else(|e| {
+                    tracing::warn!(error = ?e, "browse_hierarchy error");
+                    Vec::new()
+                })
+            };
+            stack.push(children.into_iter());
+        }
+
+        Ok(())
+    }
+
+    /// Collects the leaves at the current browse position and returns its branch names.
+    fn browse_level(
+        server: &C::Server,
+        tags: &mut TagCollector<'_>,
+        max_tags: usize,
+    ) -> OpcResult<Vec<String>> {
         let branch_enum = server.browse_opc_item_ids(OPC_BRANCH.0 as u32, Some(""), 0, 0)?;
 
         let branches: Vec<String> = branch_enum
@@ -655,13 +1197,36 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
             })
             .collect();
 
+        // Drain the leaf enumerator first so item IDs can be resolved in one batch.
+        let remaining = max_tags.saturating_sub(tags.len());
         let leaf_enum = server.browse_opc_item_ids(OPC_LEAF.0 as u32, Some(""), 0, 0)?;
-        for tag_res in leaf_enum {
-            if tags.len() >= max_tags {
-                return Ok(());
-            }
-            let browse_name = tag_res?;
-            let tag = match server.get_item_id(&browse_name) {
+        let leaves: Vec<String> = leaf_enum
+            .filter_map(|r| match r {
+                Ok(name) => Some(name),
+                Err(e) => {
+                    tracing::warn!(error = ?e, "Leaf iteration error, skipping");
+                    None
+                }
+            })
+            .take(remaining)
+            .collect();
+
+        let item_ids = server.get_item_ids(&leaves);
+        if item_ids.len() != leaves.len() {
+            tracing::warn!(
+                expected = leaves.len(),
+                actual = item_ids.len(),
+                "get_item_ids returned a mismatched result count"
+            );
+        }
+        // Pad a short result so no leaf is dropped; missing IDs fall back like failed ones.
+        let item_ids = item_ids.into_iter().chain(std::iter::repeat_with(|| {
+            Err(OpcError::Internal(
+                "get_item_ids returned no result for this leaf".into(),
+            ))
+        }));
+        for (browse_name, item_id) in leaves.into_iter().zip(item_ids) {
+            let tag = match item_id {
                 Ok(id) => id,
                 Err(e) => {
                     tracing::warn!(
@@ -672,39 +1237,10 @@ impl<C: ServerConnector + 'static> ComWorker<C> {
                     browse_name
                 }
             };
-            tags.push(tag.clone());
-            if let Ok(mut sink) = tags_sink.lock() {
-                sink.push(tag);
-            }
-            progress.fetch_add(1, Ordering::Relaxed);
+            tags.push(tag);
         }
 
-        for branch in branches {
-            if tags.len() >= max_tags {
-                return Ok(());
-            }
-            if let Err(e) = server.change_browse_position(OPC_BROWSE_DOWN.0 as u32, &branch) {
-                tracing::warn!(
-                    branch = %branch,
-                    error = ?e,
-                    "Failed to browse down, skipping branch"
-                );
-                continue;
-            }
-
-            if let Err(e) =
-                Self::browse_recursive(server, tags, max_tags, progress, tags_sink, depth + 1)
-            {
-                tracing::warn!(error = ?e, "browse_recursive error");
-            }
-
-            if let Err(e) = server.change_browse_position(OPC_BROWSE_UP.0 as u32, "") {
-                tracing::warn!(error = ?e, "Failed to browse up, stopping recursion");
-                break;
-            }
-        }
-
-        Ok(())
+        Ok(branches)
     }
 }
 
@@ -724,13 +1260,18 @@ mod tests {
         clippy::mixed_attributes_style,
         clippy::unreadable_literal,
         clippy::undocumented_unsafe_blocks,
-        clippy::manual_assert
+        clippy::manual_assert,
+        clippy::cast_possible_truncation
     )]
     use super::*;
     use crate::backend::connector::{
         ConnectedGroup, ConnectedServer, RemoteArray, ServerConnector, StringIterator,
     };
-    use crate::bindings::da::{tagOPCDATASOURCE, tagOPCITEMDEF, tagOPCITEMRESULT, tagOPCITEMSTATE};
+    use crate::bindings::da::{
+        OPC_NS_HIERARCHIAL, tagOPCDATASOURCE, tagOPCITEMDEF, tagOPCITEMRESULT, tagOPCITEMSTATE,
+    };
+    use windows::Win32::System::Com::{IEnumString, IEnumString_Impl};
+    use windows::core::implement;
 
     use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
 
@@ -741,6 +1282,26 @@ mod tests {
         should_fail_write: AtomicBool,
         should_fail_with_connection_error: AtomicBool,
         should_panic_on_request: AtomicBool,
+        add_group_count: AtomicUsize,
+        add_items_count: AtomicUsize,
+        added_item_count: AtomicUsize,
+        read_count: AtomicUsize,
+        remove_group_count: AtomicUsize,
+    }
+
+    /// Copies `items` into a COM-allocated array, as a server would return it.
+    fn remote_array<T>(items: Vec<T>) -> RemoteArray<T> {
+        if items.is_empty() {
+            return RemoteArray::empty();
+        }
+        let ptr = unsafe {
+            windows::Win32::System::Com::CoTaskMemAlloc(items.len() * std::mem::size_of::<T>())
+        } as *mut T;
+        let len = items.len() as u32;
+        for (i, item) in items.into_iter().enumerate() {
+            unsafe { std::ptr::write(ptr.add(i), item) };
+        }
+        RemoteArray::from_mut_ptr(ptr, len)
     }
 
     struct ConfigurableMockConnector {
@@ -758,52 +1319,50 @@ mod tests {
     impl ConnectedGroup for ConfigurableMockGroup {
         fn add_items(
             &self,
-            _items: &[tagOPCITEMDEF],
+            items: &[tagOPCITEMDEF],
         ) -> OpcResult<(
             RemoteArray<tagOPCITEMRESULT>,
             RemoteArray<windows::core::HRESULT>,
         )> {
             use windows::Win32::Foundation::S_OK;
 
-            let res = tagOPCITEMRESULT {
-                hServer: 1,
-                vtCanonicalDataType: 0,
-                wReserved: 0,
-                dwAccessRights: 1,
-                dwBlobSize: 0,
-                pBlob: std::ptr::null_mut(),
-            };
-
-            let res_ptr = unsafe {
-                windows::Win32::System::Com::CoTaskMemAlloc(std::mem::size_of::<tagOPCITEMRESULT>())
-            } as *mut tagOPCITEMRESULT;
-            unsafe {
-                std::ptr::write(res_ptr, res);
-            }
-            let res_array = RemoteArray::from_mut_ptr(res_ptr, 1);
-
-            let err_ptr = unsafe {
-                windows::Win32::System::Com::CoTaskMemAlloc(std::mem::size_of::<
-                    windows::core::HRESULT,
-                >())
-            } as *mut windows::core::HRESULT;
-            unsafe {
-                std::ptr::write(err_ptr, S_OK);
-            }
-            let err_array = RemoteArray::from_mut_ptr(err_ptr, 1);
+            self.state.add_items_count.fetch_add(1, Ordering::Relaxed);
+            let results = items
+                .iter()
+                .map(|_| tagOPCITEMRESULT {
+                    hServer: self.state.added_item_count.fetch_add(1, Ordering::Relaxed) as u32 + 1,
+                    vtCanonicalDataType: 0,
+                    wReserved: 0,
+                    dwAccessRights: 1,
+                    dwBlobSize: 0,
+                    pBlob: std::ptr::null_mut(),
+                })
+                .collect();
+            let errors = vec![S_OK; items.len()];
 
-            Ok((res_array, err_array))
+            Ok((remote_array(results), remote_array(errors)))
         }
 
         fn read(
             &self,
             _source: tagOPCDATASOURCE,
-            _server_handles: &[crate::opc_da::typedefs::ItemHandle],
+            server_handles: &[crate::opc_da::typedefs::ItemHandle],
         ) -> OpcResult<(
             RemoteArray<tagOPCITEMSTATE>,
             RemoteArray<windows::core::HRESULT>,
         )> {
-            Ok((RemoteArray::empty(), RemoteArray::empty()))
+            self.state.read_count.fetch_add(1, Ordering::Relaxed);
+            let states = server_handles
+                .iter()
+                .map(|handle| tagOPCITEMSTATE {
+                    hClient: handle.0,
+                    wQuality: 0xC0,
+                    ..Default::default()
+                })
+                .collect();
+            let errors = vec![windows::Win32::Foundation::S_OK; server_handles.len()];
+
+            Ok((remote_array(states), remote_array(errors)))
         }
 
         fn write(
@@ -883,6 +1442,7 @@ mod tests {
             if self.state.should_panic_on_request.load(Ordering::Relaxed) {
                 panic!("Simulated worker panic");
             }
+            self.state.add_group_count.fetch_add(1, Ordering::Relaxed);
             Ok(ConfigurableMockGroup {
                 state: self.state.clone(),
             })
@@ -893,6 +1453,9 @@ mod tests {
             _server_group: crate::opc_da::typedefs::GroupHandle,
             _force: bool,
         ) -> OpcResult<()> {
+            self.state
+                .remove_group_count
+                .fetch_add(1, Ordering::Relaxed);
             Ok(())
         }
     }
@@ -1121,6 +1684,178 @@ mod tests {
         }
     }
 
+    /// Stands in for a server's `IEnumString`, yielding a fixed list of names.
+    #[allow(clippy::ref_as_ptr, clippy::inline_always)]
+    #[implement(IEnumString)]
+    struct MockEnumString {
+        items: Vec<String>,
+        index: AtomicUsize,
+    }
+
+    impl IEnumString_Impl for MockEnumString_Impl {
+        fn Next(
+            &self,
+            celt: u32,
+            rgelt: *mut windows::core::PWSTR,
+            pceltfetched: *mut u32,
+        ) -> windows::core::HRESULT {
+            let index = self.index.load(Ordering::Relaxed);
+            let rgelt = unsafe { std::slice::from_raw_parts_mut(rgelt, celt as usize) };
+            let batch = self.items.iter().skip(index).take(celt as usize);
+            let mut fetched = 0;
+            for (slot, item) in rgelt.iter_mut().zip(batch) {
+                let wide: Vec<u16> = item.encode_utf16().chain(std::iter::once(0)).collect();
+                let ptr = unsafe { windows::Win32::System::Com::CoTaskMemAlloc(wide.len() * 2) }
+                    as *mut u16;
+                unsafe { std::ptr::copy_nonoverlapping(wide.as_ptr(), ptr, wide.len()) };
+                *slot = windows::core::PWSTR(ptr);
+                fetched += 1;
+            }
+            self.index.store(index + fetched, Ordering::Relaxed);
+
+            if !pceltfetched.is_null() {
+                unsafe { *pceltfetched = fetched as u32 };
+            }
+            if fetched == celt as usize {
+                windows::Win32::Foundation::S_OK
+            } else {
+                windows::Win32::Foundation::S_FALSE
+            }
+        }
+        fn Skip(&self, _celt: u32) -> windows::core::HRESULT {
+            windows::Win32::Foundation::E_NOTIMPL
+        }
+        fn Reset(&self) -> windows::core::Result<()> {
+            self.index.store(0, Ordering::Relaxed);
+            Ok(())
+        }
+        fn Clone(&self) -> windows::core::Result<IEnumString> {
+            Err(windows::core::Error::from_hresult(
+                windows::Win32::Foundation::E_NOTIMPL,
+            ))
+        }
+    }
+
+    fn string_iter(items: &[&str]) -> StringIterator {
+        let inner: IEnumString = MockEnumString {
+            items: items.iter().map(ToString::to_string).collect(),
+            index: AtomicUsize::new(0),
+        }
+        .into();
+        StringIterator::new(inner)
+    }
+
+    /// Depth of the mock hierarchical namespace below the root.
+    const TREE_DEPTH: usize = 2;
+
+    /// Hierarchical namespace where every level holds leaves `L0` and `L1`, and every level
+    /// above [`TREE_DEPTH`] holds branches `B0` and `B1` (14 leaves in total).
+    #[derive(Default)]
+    struct TreeState {
+        path: std::sync::Mutex<Vec<String>>,
+        down_count: AtomicUsize,
+        up_count: AtomicUsize,
+        /// Makes `get_item_ids` drop the last result, as a misbehaving override might.
+        short_item_ids: AtomicBool,
+    }
+
+    struct TreeMockConnector {
+        state: Arc<TreeState>,
+    }
+
+    struct TreeMockServer {
+        state: Arc<TreeState>,
+    }
+
+    impl ConnectedServer for TreeMockServer {
+        type Group = WorkerMockGroup;
+        fn query_organization(&self) -> OpcResult<u32> {
+            Ok(OPC_NS_HIERARCHIAL.0 as u32)
+        }
+        fn browse_opc_item_ids(
+            &self,
+            browse_type: u32,
+            _filter: Option<&str>,
+            _data_type: u16,
+            _access_rights: u32,
+        ) -> OpcResult<StringIterator> {
+            let depth = self.state.path.lock().unwrap().len();
+            if browse_type == OPC_BRANCH.0 as u32 {
+                let branches: &[&str] = if depth < TREE_DEPTH {
+                    &["B0", "B1"]
+                } else {
+                    &[]
+                };
+                Ok(string_iter(branches))
+            } else if browse_type == OPC_LEAF.0 as u32 {
+                Ok(string_iter(&["L0", "L1"]))
+            } else {
+                Err(OpcError::NotImplemented("mock".into()))
+            }
+        }
+        fn change_browse_position(&self, direction: u32, name: &str) -> OpcResult<()> {
+            let mut path = self.state.path.lock().unwrap();
+            if direction == OPC_BROWSE_DOWN.0 as u32 {
+                self.state.down_count.fetch_add(1, Ordering::Relaxed);
+                path.push(name.to_string());
+            } else if path.pop().is_some() {
+                self.state.up_count.fetch_add(1, Ordering::Relaxed);
+            } else {
+                return Err(OpcError::Internal("already at the root".into()));
+            }
+            Ok(())
+        }
+        fn get_item_id(&self, item_name: &str) -> OpcResult<String> {
+            let path = self.state.path.lock().unwrap();
+            let mut parts: Vec<&str> = path.iter().map(String::as_str).collect();
+            parts.push(item_name);
+            Ok(parts.join("."))
+        }
+        fn get_item_ids(&self, item_names: &[String]) -> Vec<OpcResult<String>> {
+            let mut ids: Vec<_> = item_names
+                .iter()
+                .map(|name| self.get_item_id(name))
+                .collect();
+            if self.state.short_item_ids.load(Ordering::Relaxed) {
+                ids.pop();
+            }
+            ids
+        }
+        fn add_group(
+            &self,
+            _name: &str,
+            _active: bool,
+            _update_rate: u32,
+            _client_handle: crate::opc_da::typedefs::GroupHandle,
+            _time_bias: i32,
+            _percent_deadband: f32,
+            _locale_id: u32,
+            _revised_update_rate: &mut u32,
+            _server_handle: &mut crate::opc_da::typedefs::GroupHandle,
+        ) -> OpcResult<Self::Group> {
+            Err(OpcError::NotImplemented("mock".into()))
+        }
+        fn remove_group(
+            &self,
+            _server_group: crate::opc_da::typedefs::GroupHandle,
+            _force: bool,
+        ) -> OpcResult<()> {
+            Ok(())
+        }
+    }
+
+    impl ServerConnector for TreeMockConnector {
+        type Server = TreeMockServer;
+        fn enumerate_servers(&self) -> OpcResult<Vec<String>> {
+            Ok(vec!["Mock.Tree.1".into()])
+        }
+        fn connect(&self, _server_name: &str) -> OpcResult<Self::Server> {
+            Ok(TreeMockServer {
+                state: self.state.clone(),
+            })
+        }
+    }
+
     #[tokio::test]
     async fn test_worker_read_tag_values_mismatched_lengths() {
         let worker = tokio::task::spawn_blocking(|| {
@@ -1148,6 +1883,76 @@ mod tests {
         }
     }
 
+    #[tokio::test]
+    async fn test_worker_concurrent_reads_each_get_reply() {
+        let worker = tokio::task::spawn_blocking(|| {
+            ComWorker::start(Arc::new(MismatchedConnector)).unwrap()
+        })
+        .await
+        .unwrap();
+
+        let (first, second) = tokio::join!(
+            worker.send_request(|reply| ComRequest::ReadTagValues {
+                server: "MockServer".to_string(),
+                tag_ids: vec!["Tag1".to_string()],
+                reply,
+            }),
+            worker.send_request(|reply| ComRequest::ReadTagValues {
+                server: "MockServer".to_string(),
+                tag_ids: vec!["Tag2".to_string(), "Tag3".to_string()],
+                reply,
+            }),
+        );
+
+        for result in [first, second] {
+            match result {
+                Err(OpcError::Internal(msg)) => {
+                    assert!(msg.contains("mismatched result array sizes"));
+                }
+                other => panic!("Expected OpcError::Internal, got {:?}", other),
+            }
+        }
+    }
+
+    #[test]
+    fn test_dispatch_batch_coalesces_reads_for_same_server() {
+        let state = Arc::new(MockState::default());
+        let connector = Arc::new(ConfigurableMockConnector {
+            state: state.clone(),
+        });
+        let mut cache = ServerCache::new(MAX_CACHED_SERVERS, IDLE_CONNECTION_TIMEOUT);
+        let (first_tx, mut first_rx) = oneshot::channel();
+        let (second_tx, mut second_rx) = oneshot::channel();
+        let mut batch = vec![
+            ComRequest::ReadTagValues {
+                server: "Mock.Server.1".to_string(),
+                tag_ids: vec!["Tag1".to_string()],
+                reply: first_tx,
+            },
+            ComRequest::ReadTagValues {
+                server: "Mock.Server.1".to_string(),
+                tag_ids: vec!["Tag2".to_string(), "Tag3".to_string()],
+                reply: second_tx,
+            },
+        ];
+
+        ComWorker::dispatch_batch(&mut batch, &mut cache, &connector);
+
+        assert_eq!(
+            state.read_count.load(Ordering::Relaxed),
+            1,
+            "Same-server reads in one batch should share a single group read"
+        );
+        let first = first_rx.try_recv().unwrap().unwrap();
+        let second = second_rx.try_recv().unwrap().unwrap();
+        assert!(first.iter().chain(&second).all(|v| v.quality == "Good"));
+        let tag_ids = |values: Vec<TagValue>| -> Vec<String> {
+            values.into_iter().map(|v| v.tag_id).collect()
+        };
+        assert_eq!(tag_ids(first), vec!["Tag1"]);
+        assert_eq!(tag_ids(second), vec!["Tag2", "Tag3"]);
+    }
+
     #[tokio::test]
     async fn test_worker_write_tag_value() {
         let state = Arc::new(MockState::default());
@@ -1210,6 +2015,365 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_server_cache_evicts_least_recently_used() {
+        let mut cache: ServerCache<MismatchedServer> = ServerCache::new(2, Duration::from_secs(60));
+        cache.get_or_connect("A", || Ok(MismatchedServer)).unwrap();
+        std::thread::sleep(Duration::from_millis(2));
+        cache.get_or_connect("B", || Ok(MismatchedServer)).unwrap();
+        std::thread::sleep(Duration::from_millis(2));
+
+        // Touch "A" so that "B" becomes the coldest entry.
+        cache
+            .get_or_connect("A", || panic!("A should be cached"))
+            .unwrap();
+        std::thread::sleep(Duration::from_millis(2));
+
+        cache.get_or_connect("C", || Ok(MismatchedServer)).unwrap();
+
+        assert_eq!(cache.entries.len(), 2);
+        assert!(cache.entries.contains_key("A"));
+        assert!(
+            !cache.entries.contains_key("B"),
+            "LRU entry should be evicted"
+        );
+        assert!(cache.entries.contains_key("C"));
+    }
+
+    #[test]
+    fn test_server_cache_keeps_entries_when_connect_fails() {
+        let mut cache: ServerCache<MismatchedServer> = ServerCache::new(1, Duration::from_secs(60));
+        cache.get_or_connect("A", || Ok(MismatchedServer)).unwrap();
+
+        let result = cache.get_or_connect("B", || Err(OpcError::Internal("unreachable".into())));
+
+        assert!(result.is_err());
+        assert!(
+            cache.entries.contains_key("A"),
+            "Failed connect must not evict a live connection"
+        );
+    }
+
+    #[test]
+    fn test_server_cache_evicts_idle_connections() {
+        let mut cache: ServerCache<MismatchedServer> = ServerCache::new(4, Duration::ZERO);
+        cache.get_or_connect("A", || Ok(MismatchedServer)).unwrap();
+        cache.evict_idle();
+        assert!(
+            cache.entries.is_empty(),
+            "Idle connection should be dropped"
+        );
+
+        let mut cache: ServerCache<MismatchedServer> = ServerCache::new(4, Duration::from_secs(60));
+        cache.get_or_connect("A", || Ok(MismatchedServer)).unwrap();
+        cache.evict_idle();
+        assert!(
+            cache.entries.contains_key("A"),
+            "Recent connection should be kept"
+        );
+    }
+
+    #[test]
+    fn test_evicted_connections_skip_remove_group() {
+        let state = Arc::new(MockState::default());
+        let connect = || {
+            Ok(ConfigurableMockServer {
+                state: state.clone(),
+            })
+        };
+        let tag_ids = vec!["Tag1".to_string()];
+
+        let mut cache = ServerCache::new(1, Duration::ZERO);
+        let cached = cache.get_or_connect("A", connect).unwrap();
+        ComWorker::<ConfigurableMockConnector>::handle_read("A", &tag_ids, cached).unwrap();
+        cache.evict_idle();
+        assert!(cache.entries.is_empty());
+
+        let mut cache = ServerCache::new(1, Duration::from_secs(60));
+        let cached = cache.get_or_connect("A", connect).unwrap();
+        ComWorker::<ConfigurableMockConnector>::handle_read("A", &tag_ids, cached).unwrap();
+        cache.get_or_connect("B", connect).unwrap();
+        assert!(!cache.entries.contains_key("A"));
+
+        assert_eq!(state.add_group_count.load(Ordering::Relaxed), 2);
+        assert_eq!(
+            state.remove_group_count.load(Ordering::Relaxed),
+            0,
+            "Eviction should release group proxies without a remove_group round trip"
+        );
+    }
+
+    #[test]
+    fn test_get_item_ids_default_resolves_each_name() {
+        let names = vec!["A".to_string(), "B".to_string()];
+
+        let resolved = MismatchedServer.get_item_ids(&names);
+        assert_eq!(resolved.len(), names.len());
+        assert!(resolved.iter().all(Result::is_ok));
+
+        let resolved = WorkerMockServer.get_item_ids(&names);
+        assert_eq!(resolved.len(), names.len());
+        assert!(resolved.iter().all(Result::is_err));
+    }
+
+    #[test]
+    fn test_is_connection_error_classifies_hresults() {
+        let com = |code: u32| OpcError::Com {
+            source: windows::core::Error::from_hresult(windows::core::HRESULT(code.cast_signed())),
+        };
+        for code in [0x8007_06BA, 0x8007_06BF, 0x8007_06BE, 0x8008_0005] {
+            assert!(is_connection_error(&com(code)), "{code:#010X}");
+        }
+        assert!(!is_connection_error(&com(0x8000_4005)));
+        assert!(!is_connection_error(&OpcError::Internal("x".to_string())));
+    }
+
+    #[test]
+    fn test_tag_collector_flushes_sink_in_batches() {
+        let sink = Arc::new(std::sync::Mutex::new(Vec::new()));
+        let progress = Arc::new(AtomicUsize::new(0));
+        let mut collector = TagCollector::new(&sink, &progress);
+        for i in 0..=SINK_FLUSH_BATCH {
+            collector.push(format!("Tag{i}"));
+        }
+        assert_eq!(sink.lock().unwrap().len(), SINK_FLUSH_BATCH);
+        assert_eq!(progress.load(Ordering::Relaxed), SINK_FLUSH_BATCH);
+
+        let tags = collector.finish();
+        assert_eq!(tags.len(), SINK_FLUSH_BATCH + 1);
+        assert_eq!(*sink.lock().unwrap(), tags);
+        assert_eq!(progress.load(Ordering::Relaxed), SINK_FLUSH_BATCH + 1);
+    }
+
+    #[test]
+    fn test_tag_collector_flushes_on_drop() {
+        let sink = Arc::new(std::sync::Mutex::new(Vec::new()));
+        let progress = Arc::new(AtomicUsize::new(0));
+        {
+            let mut collector = TagCollector::new(&sink, &progress);
+            collector.push("Tag1".to_string());
+        }
+        assert_eq!(*sink.lock().unwrap(), vec!["Tag1".to_string()]);
+        assert_eq!(progress.load(Ordering::Relaxed), 1);
+    }
+
+    #[test]
+    fn test_tag_collector_flushes_into_poisoned_sink() {
+        let sink = Arc::new(std::sync::Mutex::new(Vec::new()));
+        let progress = Arc::new(AtomicUsize::new(0));
+        let poisoner = Arc::clone(&sink);
+        let _ = std::thread::spawn(move || {
+            let _guard = poisoner.lock().unwrap();
+            panic!("poison the sink");
+        })
+        .join();
+        assert!(sink.is_poisoned());
+
+        let mut collector = TagCollector::new(&sink, &progress);
+        collector.push("Tag1".to_string());
+        collector.finish();
+
+        let tags = sink
+            .lock()
+            .unwrap_or_else(std::sync::PoisonError::into_inner);
+        assert_eq!(*tags, vec!["Tag1".to_string()]);
+    }
+
+    #[tokio::test]
+    async fn test_write_group_and_items_reused() {
+        let state = Arc::new(MockState::default());
+        let connector = Arc::new(ConfigurableMockConnector {
+            state: state.clone(),
+        });
+        let worker = tokio::task::spawn_blocking(move || ComWorker::start(connector).unwrap())
+            .await
+            .unwrap();
+
+        for value in [1, 2] {
+            let result = worker
+                .send_request(|reply| ComRequest::WriteTagValue {
+                    server: "Mock.Server.1".to_string(),
+                    tag_id: "Tag1".to_string(),
+                    value: OpcValue::Int(value),
+                    reply,
+                })
+                .await
+                .unwrap();
+            assert!(result.success);
+        }
+
+        assert_eq!(
+            state.add_group_count.load(Ordering::Relaxed),
+            1,
+            "Write group should persist across requests"
+        );
+        assert_eq!(
+            state.add_items_count.load(Ordering::Relaxed),
+            1,
+            "Tag should only be added to the group on its first write"
+        );
+    }
+
+    #[tokio::test]
+    async fn test_read_group_and_items_reused() {
+        let state = Arc::new(MockState::default());
+        let connector = Arc::new(ConfigurableMockConnector {
+            state: state.clone(),
+        });
+        let worker = tokio::task::spawn_blocking(move || ComWorker::start(connector).unwrap())
+            .await
+            .unwrap();
+
+        for tag_ids in [vec!["Tag1", "Tag2"], vec!["Tag2", "Tag3", "Tag3"]] {
+            let tag_ids: Vec<String> = tag_ids.into_iter().map(String::from).collect();
+            let values = worker
+                .send_request(|reply| ComRequest::ReadTagValues {
+                    server: "Mock.Server.1".to_string(),
+                    tag_ids: tag_ids.clone(),
+                    reply,
+                })
+                .await
+                .unwrap();
+            assert_eq!(
+                values.iter().map(|v| v.tag_id.as_str()).collect::<Vec<_>>(),
+                tag_ids
+            );
+            assert!(values.iter().all(|v| v.quality == "Good"));
+        }
+
+        assert_eq!(
+            state.add_group_count.load(Ordering::Relaxed),
+            1,
+            "Read group should persist across requests"
+        );
+        assert_eq!(state.add_items_count.load(Ordering::Relaxed), 2);
+        assert_eq!(
+            state.added_item_count.load(Ordering::Relaxed),
+            3,
+            "Only tags not already in the group should be added, once each"
+        );
+        assert_eq!(state.read_count.load(Ordering::Relaxed), 2);
+    }
+
+    #[tokio::test]
+    async fn test_full_read_group_is_recreated() {
+        let state = Arc::new(MockState::default());
+        let connector = Arc::new(ConfigurableMockConnector {
+            state: state.clone(),
+        });
+        let worker = tokio::task::spawn_blocking(move || ComWorker::start(connector).unwrap())
+            .await
+            .unwrap();
+
+        let full: Vec<String> = (0..MAX_GROUP_ITEMS).map(|i| format!("Tag{i}")).collect();
+        for tag_ids in [full, vec!["Tag0".to_string()]] {
+            worker
+                .send_request(|reply| ComRequest::ReadTagValues {
+                    server: "Mock.Server.1".to_string(),
+                    tag_ids,
+                    reply,
+                })
+                .await
+                .unwrap();
+        }
+
+        assert_eq!(
+            state.add_group_count.load(Ordering::Relaxed),
+            2,
+            "A group holding MAX_GROUP_ITEMS items should be replaced"
+        );
+        assert_eq!(
+            state.added_item_count.load(Ordering::Relaxed),
+            MAX_GROUP_ITEMS + 1,
+            "The fresh group starts without the old group's items"
+        );
+    }
+
+    #[tokio::test]
+    async fn test_worker_browse_tags_hierarchical() {
+        let state = Arc::new(TreeState::default());
+        let connector = Arc::new(TreeMockConnector {
+            state: state.clone(),
+        });
+        let worker = tokio::task::spawn_blocking(move || ComWorker::start(connector).unwrap())
+            .await
+            .unwrap();
+
+        let progress = Arc::new(AtomicUsize::new(0));
+        let sink = Arc::new(std::sync::Mutex::new(Vec::new()));
+        let tags = worker
+            .send_request(|reply| ComRequest::BrowseTags {
+                server: "Mock.Tree.1".to_string(),
+                max_tags: 100,
+                progress: progress.clone(),
+                tags_sink: sink.clone(),
+                reply,
+            })
+            .await
+            .unwrap();
+
+        assert_eq!(tags.len(), 14);
+        assert_eq!(tags[..4], ["L0", "L1", "B0.L0", "B0.L1"]);
+        assert_eq!(*sink.lock().unwrap(), tags);
+        assert_eq!(progress.load(Ordering::Relaxed), 14);
+        assert!(state.path.lock().unwrap().is_empty());
+
+        // The worker is still alive after the browse.
+        let servers = worker
+            .send_request(|reply| ComRequest::ListServers {
+                host: "localhost".into(),
+                reply,
+            })
+            .await
+            .unwrap();
+        assert_eq!(servers, vec!["Mock.Tree.1".to_string()]);
+    }
+
+    #[test]
+    fn test_browse_hierarchy_returns_to_start_when_max_tags_reached() {
+        let state = Arc::new(TreeState::default());
+        let server = TreeMockServer {
+            state: state.clone(),
+        };
+        let sink = Arc::new(std::sync::Mutex::new(Vec::new()));
+        let progress = Arc::new(AtomicUsize::new(0));
+        let mut tags = TagCollector::new(&sink, &progress);
+
+        // Two root leaves, two in B0, then the cap is hit inside B0.B0.
+        ComWorker::<TreeMockConnector>::browse_hierarchy(&server, &mut tags, 5).unwrap();
+
+        assert_eq!(
+            tags.finish(),
+            vec!["L0", "L1", "B0.L0", "B0.L1", "B0.B0.L0"]
+        );
+        assert_eq!(state.down_count.load(Ordering::Relaxed), 2);
+        assert_eq!(
+            state.up_count.load(Ordering::Relaxed),
+            state.down_count.load(Ordering::Relaxed),
+            "Every DOWN should be matched by an UP"
+        );
+        assert!(state.path.lock().unwrap().is_empty());
+    }
+
+    #[test]
+    fn test_browse_level_keeps_leaves_missing_from_get_item_ids() {
+        let state = Arc::new(TreeState::default());
+        state.short_item_ids.store(true, Ordering::Relaxed);
+        let server = TreeMockServer {
+            state: state.clone(),
+        };
+        let sink = Arc::new(std::sync::Mutex::new(Vec::new()));
+        let progress = Arc::new(AtomicUsize::new(0));
+        let mut tags = TagCollector::new(&sink, &progress);
+
+        ComWorker::<TreeMockConnector>::browse_hierarchy(&server, &mut tags, 100).unwrap();
+
+        let tags = tags.finish();
+        assert_eq!(tags.len(), 14, "No leaf should be dropped");
+        // The leaf without a resolved ID falls back to its browse name.
+        assert_eq!(tags[..4], ["L0", "L1", "B0.L0", "L1"]);
+    }
+
     #[tokio::test]
     async fn test_stale_connection_eviction() {
         let state = Arc::new(MockState::default());
@@ -1253,6 +2417,26 @@ mod tests {
             2,
             "Stale connection should be evicted and reconnected"
         );
+
+        // The retry also hit a connection error, so the fresh connection was not pooled.
+        state
+            .should_fail_with_connection_error
+            .store(false, Ordering::Relaxed);
+        let _ = worker
+            .send_request(|reply| ComRequest::WriteTagValue {
+                server: "Mock.Server.1".to_string(),
+                tag_id: "Tag3".to_string(),
+                value: OpcValue::Int(3),
+                reply,
+            })
+            .await
+            .unwrap();
+
+        assert_eq!(
+            state.connect_count.load(Ordering::Relaxed),
+            3,
+            "Connection that failed its retry should not stay cached"
+        );
     }
 
     #[tokio::test]
@@ -19,6 +19,10 @@
 //! # }
 //! ```
 //!
+//! Applications that use Tokio only to drive this client can run it on
+//! [`build_runtime`], a single-threaded runtime, instead of `#[tokio::main]`'s
+//! multi-threaded default: all COM work happens on the client's own worker thread.
+//!
 //! ## Feature Flags
 //!
 //! | Flag | Default | Effect |
@@ -34,6 +38,7 @@ mod com_guard;
 pub(crate) use com_guard::ComGuard;
 mod helpers;
 mod provider;
+mod runtime;
 
 #[cfg(feature = "opc-da-backend")]
 #[allow(warnings)]
@@ -50,6 +55,7 @@ mod backend;
 // Stable public API
 pub use helpers::{format_hresult, friendly_com_hint, log_opc_error};
 pub use provider::{OpcProvider, OpcValue, TagValue, WriteResult};
+pub use runtime::build_runtime;
 
 #[cfg(feature = "opc-da-backend")]
 pub use opc_da::{
@@ -5,7 +5,7 @@ use windows::core::HRESULT;
 pub type OpcResult<T> = Result<T, OpcError>;
 
 /// Centralized error enum for the OPC DA client.
-#[derive(Debug, Error)]
+#[derive(Debug, Clone, Error)]
 #[non_exhaustive]
 pub enum OpcError {
     /// Standard Windows COM/DCOM error.
@@ -0,0 +1,45 @@
+//! Minimal Tokio runtime for applications that only drive this client.
+//!
+//! All COM work happens on the client's own dedicated worker thread; the
+//! caller's runtime only awaits a bounded `mpsc` send and a `oneshot` reply.
+//! A multi-threaded runtime adds nothing for that workload.
+
+use tokio::runtime::{Builder, Runtime};
+
+/// Builds a single-threaded Tokio runtime sized for driving an [`OpcProvider`].
+///
+/// The runtime runs on the calling thread and has a blocking pool of at most
+/// one thread. Applications that only talk to OPC servers through this crate
+/// can use it instead of the default multi-threaded runtime, avoiding one
+/// idle worker thread per CPU core.
+///
+/// Applications that run their own CPU-bound or blocking work on the runtime
+/// should keep a multi-threaded runtime instead.
+///
+/// # Errors
+///
+/// Returns the I/O error reported by Tokio if the runtime cannot be created.
+///
+/// # Examples
+///
+/// ```no_run
+/// # use anyhow::Result;
+/// use opc_da_client::{OpcDaClient, OpcProvider, build_runtime};
+///
+/// # fn main() -> Result<()> {
+/// let runtime = build_runtime()?;
+/// let servers = runtime.block_on(async {
+///     let client = OpcDaClient::default();
+///     client.list_servers("localhost").await
+/// })?;
+/// # Ok(())
+/// # }
+/// ```
+///
+/// [`OpcProvider`]: crate::OpcProvider
+pub fn build_runtime() -> std::io::Result<Runtime> {
+    Builder::new_current_thread()
+        .enable_all()
+        .max_blocking_threads(1)
+        .build()
+}